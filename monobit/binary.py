@@ -27,6 +27,12 @@ def bytes_to_bits(inbytes, width=None, align='left'):
     else:
         return bits[:width]
 
+def bytes_to_bitstr(inbytes):
+    """Convert bytes/bytearray to string of '0' and '1' characters."""
+    if not inbytes:
+        return ''
+    return bin(int.from_bytes(inbytes, 'big'))[2:].zfill(8*len(inbytes))
+
 def int_to_bytes(in_int, byteorder='big'):
     """Convert integer to bytes."""
     return in_int.to_bytes(max(1, ceildiv(in_int.bit_length(), 8)), byteorder)
@@ -18,6 +18,8 @@ from .properties import Props
 
 class HasProps:
 
+    __slots__ = ('_cache', '_props')
+
     _defaults = {}
     _converters = {}
 
@@ -43,9 +45,15 @@ class HasProps:
             return type(self)._defaults[field]
 
     def __getattr__(self, field):
-        if not field.startswith('_'):
+        # private and dunder names are never properties
+        if field[:1] != '_':
+            # inlined _get_property, as this is on the path of every property read
             try:
-                return self._get_property(field)
+                return self._props[field]
+            except KeyError:
+                pass
+            try:
+                return type(self)._defaults[field]
             except KeyError:
                 pass
         raise AttributeError(field)
@@ -70,12 +78,16 @@ class HasProps:
             assert value is not None
             self._props[field] = value
 
-    def _set_properties(self, props):
-        converters = tuple(type(self)._converters.get(_f, None) for _f in props)
+    def _set_properties(self, props, trusted=()):
+        """Set properties; values for keys in `trusted` are already converted."""
+        converters = tuple(
+            None if _f in trusted else type(self)._converters.get(_f, None)
+            for _f in props
+        )
         self._props = {
             _k: _conv(_v) if _conv else _v
             for (_k, _v), _conv in zip(props.items(), converters)
-            if _v is not None and (
+            if _k in trusted or _v is not None and (
                 not hasattr(type(self), _k)
                 # fset does not exist (not a property) or equals None (not settable)
                 or getattr(getattr(type(self), _k), 'fset', None) is not None
@@ -622,6 +622,9 @@ class CharmapRegistry:
     # directly stored encoders
     _stored = {}
 
+    # charmaps loaded from registered files, by normalised name
+    _loaded = {}
+
     # table of encoding aliases
     _aliases = {}
 
@@ -656,6 +659,7 @@ class CharmapRegistry:
         if normname in cls._overlays:
             del cls._overlays[normname]
         cls._registered[normname] = dict(name=name, filename=filename, format=format, **kwargs)
+        cls._loaded.pop(normname, None)
 
     @classmethod
     def add_type(cls, name, encoder_class):
@@ -679,6 +683,7 @@ class CharmapRegistry:
             cls._overlays[normname].append(ovr_dict)
         except KeyError:
             cls._overlays[normname] = [(ovr_dict)]
+        cls._loaded.pop(normname, None)
 
     @classmethod
     def alias(cls, alias, name):
@@ -698,6 +703,8 @@ class CharmapRegistry:
                 alias, name, cls._aliases[alias]
             )
         cls._aliases[alias] = name
+        # normalised names may resolve differently now
+        cls._loaded.clear()
 
     @classmethod
     def is_unicode(cls, name):
@@ -756,6 +763,11 @@ class CharmapRegistry:
             return self._stored[normname]()
         except KeyError:
             pass
+        # charmaps are not modified after creation, so they can be shared
+        try:
+            return self._loaded[normname]
+        except KeyError:
+            pass
         try:
             charmap_dict = self._registered[normname]
         except KeyError as exc:
@@ -769,6 +781,7 @@ class CharmapRegistry:
             ovr_rng = ovr_dict.pop('codepoint_range')
             overlay = self.load(**ovr_dict)
             charmap = charmap.overlay(overlay, ovr_rng)
+        self._loaded[normname] = charmap
         return charmap
 
     def fit(self, charmap):
@@ -5,9 +5,9 @@ monobit.font - representation of font
 licence: https://opensource.org/licenses/MIT
 """
 
+import os
 import logging
-from functools import wraps, partial, cache
-from pathlib import PurePath
+from functools import wraps, partial, cache, lru_cache
 from unicodedata import normalize
 
 from .scripting import scriptable, get_scriptables, Any
@@ -20,7 +20,7 @@ from .taggers import tagger
 from .labels import Tag, Char, Codepoint, Label, to_label
 from .binary import ceildiv
 from .properties import extend_string
-from .cachedprops import HasProps, writable_property, checked_property
+from .cachedprops import HasProps, writable_property, checked_property, cached
 from .taggers import tagmaps
 
 
@@ -31,6 +31,12 @@ def encoder_or_tagger(obj):
     return enc
 
 
+@lru_cache(maxsize=256)
+def _get_blank_glyph(width=0, height=0, shift_up=0):
+    """Blank glyph, shared between fonts as glyphs are immutable."""
+    return Glyph.blank(width=width, height=height, shift_up=shift_up)
+
+
 ###############################################################################
 # font class
 
@@ -193,6 +199,8 @@ class FontProperties:
 class Font(HasProps):
     """Representation of font, including glyphs and metadata."""
 
+    __slots__ = ('_glyphs', '_labels', '_comment')
+
     _defaults = vars(FontProperties)
     _converters = HasProps.get_converters(FontProperties)
 
@@ -236,7 +244,15 @@ class Font(HasProps):
     def family(self):
         """Name of font family."""
         # use source name if no family name defined
-        stem = PurePath(self.source_name).stem
+        # take the last path element, split on the native and alternative
+        # separators so that directory names given by some loaders work too
+        name = self.source_name
+        if os.altsep:
+            name = name.replace(os.altsep, os.sep)
+        name = name.rstrip(os.sep).rpartition(os.sep)[2]
+        stem, _, suffix = name.rpartition('.')
+        if not stem or not suffix:
+            stem = name
         # change underscored/spaced filenames to camelcase font name
         # replace underscores with spaces
         stem = stem.replace('_', ' ')
@@ -380,31 +396,29 @@ class Font(HasProps):
         #
         if not self.glyphs:
             return 'character-cell'
-        if any(
-                _glyph.right_kerning or _glyph.left_kerning
-                for _glyph in self.glyphs
-            ):
-            return 'proportional'
-        if self.has_vertical_metrics():
-            advances = set(
-                (_glyph.advance_width, _glyph.advance_height)
-                for _glyph in self.glyphs if _glyph.advance_width
-            )
-        else:
+        vertical = self.has_vertical_metrics()
+        advances = set()
+        for _glyph in self.glyphs:
+            if _glyph.right_kerning or _glyph.left_kerning:
+                return 'proportional'
             # don't count void glyphs (0 width and/or height)
             # to determine whether it's monospace
-            advances = set(
-                _glyph.advance_width
-                for _glyph in self.glyphs if _glyph.advance_width
-            )
-        if len(set(advances)) > 2:
+            advance_width = _glyph.advance_width
+            if not advance_width:
+                continue
+            if vertical:
+                advances.add((advance_width, _glyph.advance_height))
+            else:
+                advances.add(advance_width)
+        n_advances = len(advances)
+        if n_advances > 2:
             return 'proportional'
-        monospaced = len(set(advances)) == 1
+        monospaced = n_advances == 1
         # check if all glyphs are rendered within the line height
         # if there are vertical overlaps, it is not a charcell font
         if (
                 (self.ink_bounds.top - self.ink_bounds.bottom > self.line_height)
-                or self.has_vertical_metrics() and (
+                or vertical and (
                     self.ink_bounds.right - self.ink_bounds.left > self.line_width
                 )
             ):
@@ -426,9 +440,34 @@ class Font(HasProps):
         Minimum box encompassing all glyph matrices overlaid at fixed origin,
         bottom-left origin coordinates.
         """
+        raster, _, _ = self._get_glyph_aggregates()
+        return raster
+
+    @cached
+    def _get_glyph_aggregates(self):
+        """
+        Raster bounds, total and maximum advance width,
+        aggregated in a single pass over the glyphs.
+        """
         if not self.glyphs:
-            return Bounds(0, 0, 0, 0)
-        return Glyph._get_common_raster(*self.glyphs)
+            return Bounds(0, 0, 0, 0), 0, 0
+        left, bottom, right, top = self.glyphs[0].raster
+        total_advance, max_advance = 0, self.glyphs[0].advance_width
+        for _glyph in self.glyphs:
+            _left, _bottom, _right, _top = _glyph.raster
+            if _left < left:
+                left = _left
+            if _bottom < bottom:
+                bottom = _bottom
+            if _right > right:
+                right = _right
+            if _top > top:
+                top = _top
+            _advance = _glyph.advance_width
+            total_advance += _advance
+            if _advance > max_advance:
+                max_advance = _advance
+        return Bounds(left, bottom, right, top), total_advance, max_advance
 
     @checked_property
     def raster_size(self):
@@ -444,21 +483,22 @@ class Font(HasProps):
         if not self.glyphs or self.spacing not in ('character-cell', 'multi-cell'):
             return Coord(0, 0)
         if self.has_vertical_metrics():
-            cells = tuple(
+            cells = (
                 (_g.advance_width, _g.advance_height)
                 for _g in self.glyphs
             )
         else:
-            cells = tuple(
-                (_g.advance_width, self.line_height)
+            line_height = self.line_height
+            cells = (
+                (_g.advance_width, line_height)
                 for _g in self.glyphs
             )
-        sizes = tuple(_c for _c in cells if all(_c))
-        if not sizes:
-            return Coord(0, 0)
         # smaller of the (at most two) advance widths is the cell size
         # in a multi-cell font, some glyphs may take up two cells.
-        return Coord(*min(sizes))
+        size = min((_c for _c in cells if all(_c)), default=None)
+        if size is None:
+            return Coord(0, 0)
+        return Coord(*size)
 
     @checked_property
     def ink_bounds(self):
@@ -466,22 +506,26 @@ class Font(HasProps):
         Minimum bounding box encompassing all glyphs at fixed origin,
         bottom-left origin cordinates.
         """
-        nonempty = [
-            _glyph for _glyph in self.glyphs
-            if _glyph.bounding_box.x and _glyph.bounding_box.y
-        ]
-        if not nonempty:
+        bounds = None
+        for _glyph in self.glyphs:
+            _left, _bottom, _right, _top = _glyph.ink_bounds
+            # skip glyphs without ink
+            if _left == _right or _bottom == _top:
+                continue
+            if bounds is None:
+                left, bottom, right, top = bounds = _glyph.ink_bounds
+                continue
+            if _left < left:
+                left = _left
+            if _bottom < bottom:
+                bottom = _bottom
+            if _right > right:
+                right = _right
+            if _top > top:
+                top = _top
+        if bounds is None:
             return Bounds(0, 0, 0, 0)
-        lefts, bottoms, rights, tops = zip(*(
-            _glyph.ink_bounds
-            for _glyph in nonempty
-        ))
-        return Bounds(
-            left=min(lefts),
-            bottom=min(bottoms),
-            right=max(rights),
-            top=max(tops)
-        )
+        return Bounds(left, bottom, right, top)
 
     @checked_property
     def bounding_box(self):
@@ -509,17 +553,14 @@ class Font(HasProps):
         """Get average glyph advance width."""
         if not self.glyphs:
             return 0
-        return (
-            sum(_glyph.advance_width for _glyph in self.glyphs)
-            / len(self.glyphs)
-        )
+        _, total_advance, _ = self._get_glyph_aggregates()
+        return total_advance / len(self.glyphs)
 
     @writable_property
     def max_width(self):
         """Maximum glyph advance width."""
-        if not self.glyphs:
-            return 0
-        return max(_glyph.advance_width for _glyph in self.glyphs)
+        _, _, max_advance = self._get_glyph_aggregates()
+        return max_advance
 
     @writable_property
     def cap_width(self):
@@ -646,25 +687,32 @@ class Font(HasProps):
     @writable_property
     def default_char(self):
         """Label for default character."""
-        repl = '\ufffd'
-        if repl not in self.get_chars():
-            repl = ''
-        return Char(repl)
+        repl = Char('\ufffd')
+        # look up in the label table rather than scanning the char tuple
+        if repl not in self._labels:
+            return Char('')
+        return repl
 
 
     ###########################################################################
 
 
-    def __init__(self, glyphs=(), *, comment=None, **properties):
+    def __init__(
+            self, glyphs=(), *, comment=None,
+            _labels=None, _trusted=(), **properties
+        ):
         """Create new font."""
         super().__init__()
         self._glyphs = tuple(glyphs)
         # construct lookup tables
-        self._labels = {
-            _label: _index
-            for _index, _glyph in enumerate(self._glyphs)
-            for _label in _glyph.get_labels()
-        }
+        # unless a table for the same glyph sequence is passed in
+        if _labels is None:
+            _labels = {
+                _label: _index
+                for _index, _glyph in enumerate(self._glyphs)
+                for _label in _glyph.get_labels()
+            }
+        self._labels = _labels
         # comment can be str (just global comment) or mapping of property comments
         if isinstance(comment, str):
             comment = {'': comment}
@@ -675,7 +723,7 @@ class Font(HasProps):
         # update properties
         # NOTE - we must be careful NOT TO ACCESS CACHED PROPERTIES
         #        until the constructor is complete
-        self._set_properties(properties)
+        self._set_properties(properties, _trusted)
 
     @staticmethod
     def _apply_metrics(glyphs, props):
@@ -736,6 +784,11 @@ class Font(HasProps):
         """Return a copy of the font with changes."""
         if glyphs is NOT_SET:
             glyphs = self._glyphs
+            # glyph labels are unchanged, reuse the lookup table
+            labels = self._labels
+        else:
+            glyphs = tuple(glyphs)
+            labels = None
         old_comment = self._get_comment_dict()
         if isinstance(comment, str):
             old_comment[''] = comment
@@ -745,8 +798,11 @@ class Font(HasProps):
         properties = {**self._props}
         properties.update(kwargs)
         return Font(
-            tuple(glyphs),
+            glyphs,
             comment=old_comment,
+            _labels=labels,
+            # stored properties have been converted before
+            _trusted=self._props.keys() - kwargs.keys(),
             **properties
         )
 
@@ -817,7 +873,7 @@ class Font(HasProps):
 
         return FontFormatter().format(template, **kwargs)
 
-    @cache
+    @cached
     def has_vertical_metrics(self):
         """Check if this font has vertical metrics."""
         if any(
@@ -883,10 +939,10 @@ class Font(HasProps):
 
     def get_index(self, label=None, *, char=None, codepoint=None, tag=None):
         """Get index for given label, if defined."""
-        if 1 != len([
-                _indexer for _indexer in (label, char, codepoint, tag)
-                if _indexer is not None
-            ]):
+        if 1 != (
+                (label is not None) + (char is not None)
+                + (codepoint is not None) + (tag is not None)
+            ):
             raise ValueError('get_index() takes exactly one parameter.')
         if char is not None:
             label = Char(char)
@@ -906,7 +962,7 @@ class Font(HasProps):
             pass
         raise KeyError(f'No glyph found matching label={label}')
 
-    @cache
+    @cached
     def get_default_glyph(self):
         """Get default glyph; empty if not defined."""
         try:
@@ -915,48 +971,61 @@ class Font(HasProps):
             # use fully inked space-sized block if default glyph undefined
             return self.get_space_glyph().invert()
 
-    @cache
+    @cached
     def get_space_glyph(self):
         """Get blank glyph with advance width defined by word-space property."""
         # pylint: disable=invalid-unary-operand-type
-        return Glyph.blank(
+        return _get_blank_glyph(
             width=self.word_space, height=self.pixel_size,
             shift_up=-self.descent
         )
 
-    @cache
     def get_empty_glyph(self):
         """Get blank glyph with zero advance_width and advance_height."""
-        return Glyph.blank()
+        return _get_blank_glyph()
 
 
     ##########################################################################
     # label access
 
-    @cache
+    @cached
+    def _get_labels_by_type(self):
+        """Split labels into chars, codepoints and tags in a single pass."""
+        chars, codepoints, tags = [], [], []
+        for _label in self._labels:
+            if isinstance(_label, Char):
+                chars.append(_label)
+            elif isinstance(_label, Codepoint):
+                codepoints.append(_label)
+            elif isinstance(_label, Tag):
+                tags.append(_label)
+        return tuple(chars), tuple(codepoints), tuple(tags)
+
     def get_chars(self):
         """Get tuple of characters covered by this font."""
-        return tuple(_c for _c in self._labels if isinstance(_c, Char))
+        chars, _, _ = self._get_labels_by_type()
+        return chars
 
-    @cache
     def get_codepoints(self):
         """Get tuple of codepage codepoints covered by this font."""
-        return tuple(_c for _c in self._labels if isinstance(_c, Codepoint))
+        _, codepoints, _ = self._get_labels_by_type()
+        return codepoints
 
-    @cache
     def get_tags(self):
         """Get tuple of tags covered by this font."""
-        return tuple(_c for _c in self._labels if isinstance(_c, Tag))
+        _, _, tags = self._get_labels_by_type()
+        return tags
 
-    @cache
+    @cached
     def get_charmap(self):
         """Implied character map based on defined chars."""
-        return charmaps.create({
-            _glyph.codepoint: _glyph.char
-            for _glyph in self._glyphs
-            if _glyph.codepoint
-            and _glyph.char
-        }, name=f"implied-{self.name}")
+        mapping = {}
+        for _glyph in self._glyphs:
+            # each of these filters the glyph labels, so read them once
+            codepoint, char = _glyph.codepoint, _glyph.char
+            if codepoint and char:
+                mapping[codepoint] = char
+        return charmaps.create(mapping, name=f"implied-{self.name}")
 
 
     ##########################################################################
@@ -1072,7 +1141,7 @@ class Font(HasProps):
         glyphs = [
             _glyph
             for _glyph in self.glyphs
-            if not (set(_glyph.get_labels()) & set(labels))
+            if labels.isdisjoint(_glyph.get_labels())
         ]
         return self.modify(glyphs)
 
@@ -1125,6 +1194,9 @@ class Font(HasProps):
     # transformations
 
     def _apply_to_all_glyphs(self, operation, **kwargs):
+        # arguments have already been converted by the font operation
+        # so skip the scriptable wrapper and call the glyph operation directly
+        operation = getattr(operation, '__wrapped__', operation)
         glyphs = tuple(
             operation(_g, **kwargs) for _g in self.glyphs
         )
@@ -1281,7 +1353,8 @@ class Font(HasProps):
         if not self.glyphs:
             return self
         # absolute value of most negative upshift, left_bearing, right_bearing
-        add_shift_up = max(0, -min(_g.shift_up for _g in self.glyphs))
+        # the lowest upshift is the bottom of the common raster
+        add_shift_up = max(0, -self.raster.bottom)
         add_left_bearing = 0 #max(0, -min(_g.left_bearing for _g in self.glyphs))
         add_right_bearing = 0 #max(0, -min(_g.right_bearing for _g in self.glyphs))
         glyphs = tuple(
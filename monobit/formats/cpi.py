@@ -10,7 +10,6 @@ import string
 import logging
 from itertools import accumulate
 
-from ..binary import ceildiv
 from ..struct import little_endian as le, sizeof
 from ..storage import loaders, savers
 from ..magic import FileFormatError, Magic
@@ -317,7 +316,9 @@ def _parse_cp(data, cpeh_offset, header_id=_ID_MS, drdos_effh=None, standalone=F
         fh_offset += _SCREEN_FONT_HEADER.size
         # get the bitmap
         if cpih.version == _CP_FONT:
-            bytesize = fh.height * ceildiv(fh.width, 8)
+            # bytes per row, rounded up
+            row_bytes = (fh.width + 7) >> 3
+            bytesize = fh.height * row_bytes
             # bitmaps are in between headers for FONT and FONT.NT
             bm_offset = fh_offset
             fh_offset += fh.num_chars * bytesize
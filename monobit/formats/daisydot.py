@@ -12,9 +12,8 @@ from ..struct import big_endian as be
 from ..storage import loaders, savers
 from ..font import Font
 from ..glyph import Glyph
-from ..raster import Raster
 from ..magic import FileFormatError
-from ..binary import ceildiv, bytes_to_bits
+from ..binary import ceildiv, bytes_to_bitstr
 
 
 # Daisy-Dot II
@@ -68,6 +67,18 @@ def _read_daisy(instream):
         'Not a Daisy-Dot file: magic does not match either version'
     )
 
+def _passes_to_rows(pass0, pass1):
+    """Get pixel rows from two interleaved print passes, given as bit strings."""
+    length = min(len(pass0), len(pass1))
+    if not length:
+        return ()
+    # each byte is a column of 8 pixels; passes alternate by row
+    return tuple(
+        _pass[_bit:length:8]
+        for _bit in range(8)
+        for _pass in (pass0, pass1)
+    )
+
 def _parse_daisy2(data):
     """Read daisy-dot II binary file and return glyphs."""
     ofs = len(_DD2_MAGIC)
@@ -76,13 +87,11 @@ def _parse_daisy2(data):
         width = data[ofs]
         if width < 1 or width > 19:
             logging.warning('Glyph width outside of allowed values, continuing')
-        pass0 = bytes_to_bits(data[ofs+1:ofs+width+1])
-        pass1 = bytes_to_bits(data[ofs+width+1:ofs+2*width+1])
-        bits = tuple(_b for _pair in zip(pass0, pass1) for _b in _pair)
-        glyphs.append(
-            Glyph.from_vector(bits, stride=16, codepoint=cp)
-            .transpose(adjust_metrics=False)
+        rows = _passes_to_rows(
+            bytes_to_bitstr(data[ofs+1:ofs+width+1]),
+            bytes_to_bitstr(data[ofs+width+1:ofs+2*width+1]),
         )
+        glyphs.append(Glyph(rows, codepoint=cp, _0='0', _1='1'))
         # separated by a \x9b
         ofs += 2*width + 2
     props = None
@@ -100,25 +109,18 @@ def _parse_daisy3(data):
         if width < 1 or width > 32:
             logging.warning('Glyph width outside of allowed values, continuing')
         double = bool(double)
-        passes = [
-            bytes_to_bits(data[ofs:ofs+width]),
-            bytes_to_bits(data[ofs+width:ofs+2*width])
-        ]
-        bits = tuple(_b for _tup in zip(*passes) for _b in _tup)
-        # we transpose, so stride is based on row height which is fixed
-        matrix = Raster.from_vector(bits, stride=16).transpose().as_matrix()
+        rows = _passes_to_rows(
+            bytes_to_bitstr(data[ofs:ofs+width]),
+            bytes_to_bitstr(data[ofs+width:ofs+2*width]),
+        )
         ofs += 2*width
         if double:
-            passes = [
-                bytes_to_bits(data[ofs:ofs+width]),
-                bytes_to_bits(data[ofs+width:ofs+2*width])
-            ]
-            ofs += 2*width
-            bits = tuple(_b for _tup in zip(*passes) for _b in _tup)
-            matrix += (
-                Raster.from_vector(bits, stride=16).transpose().as_matrix()
+            rows += _passes_to_rows(
+                bytes_to_bitstr(data[ofs:ofs+width]),
+                bytes_to_bitstr(data[ofs+width:ofs+2*width]),
             )
-        glyphs.append(Glyph(matrix, codepoint=cp))
+            ofs += 2*width
+        glyphs.append(Glyph(rows, codepoint=cp, _0='0', _1='1'))
         # in dd3, not separated by a \x9b
     dd3_props = _DD3_FINAL.from_bytes(data, ofs)
     # extend non-doubled glyphs
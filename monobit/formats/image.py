@@ -7,10 +7,12 @@ licence: https://opensource.org/licenses/MIT
 
 import logging
 from collections import Counter
+from functools import reduce
+from itertools import islice
 from pathlib import Path
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageChops
 except ImportError:
     Image = None
 
@@ -101,7 +103,9 @@ if Image:
                 table_size = Coord(0, 0)
         # maximum number of cells that fits
         img = Image.open(infile)
-        img = img.convert('RGB')
+        # bilevel and greyscale images are used as they are, with scalar pixels
+        if img.mode not in ('1', 'L'):
+            img = img.convert('RGB')
         cell_x, cell_y = cell
         if cell.x <= 0:
             if table_size.x <= 0:
@@ -124,6 +128,9 @@ if Image:
         if table_size.y <= 0:
             table_size_y = ceildiv(img.height - margin.y, step_y)
         traverse = grid_traverser(table_size_x, table_size_y, order, direction)
+        # only visit the cells we need
+        if count > 0:
+            traverse = islice(traverse, count)
         # extract sub-images
         crops = tuple(
             img.crop((
@@ -137,32 +144,32 @@ if Image:
         if not crops:
             logging.error('Image too small; no characters found.')
             return Font()
-        if count > 0:
-            crops = crops[:count]
         # scale
-        crops = tuple(_crop.resize(cell, resample=Image.NEAREST) for _crop in crops)
+        if scale != (1, 1):
+            crops = tuple(
+                _crop.resize(cell, resample=Image.NEAREST) for _crop in crops
+            )
         # determine colour mode (2- or 3-colour)
-        colourset = set(img.getdata())
-        if len(colourset) > 3:
+        n_colours = len(img.getcolors(img.width * img.height))
+        if n_colours > 3:
             raise FileFormatError(
-                f'More than three colours ({len(colourset)}) found in image. '
+                f'More than three colours ({n_colours}) found in image. '
                 'Colour, greyscale and antialiased glyphs are not supported. '
             )
         # three-colour mode - proportional width encoded with border colour
-        elif len(colourset) == 3:
+        elif n_colours == 3:
             # get border/padding colour
             border = _get_border_colour(img, cell, margin, padding)
             # clip off border colour from cells
-            crops = tuple(_crop_border(_crop, border) for _crop in crops)
-        # get pixels
-        paper, ink = _identify_colours(crops, background)
+            if border is not None:
+                crops = tuple(_crop_border(_crop, border) for _crop in crops)
+        # get paper colour
+        paper, _ = _identify_colours(crops, background)
         # convert to glyphs, set codepoints
+        masks = (_get_ink_mask(_crop, paper) for _crop in crops)
         glyphs = tuple(
-            Glyph.from_vector(
-                tuple(_crop.getdata()), stride=_crop.width, _0=paper, _1=ink,
-                codepoint=_index,
-            )
-            for _index, _crop in enumerate(crops, first_codepoint)
+            Glyph.from_bytes(_mask.tobytes(), _mask.width, codepoint=_index)
+            for _index, _mask in enumerate(masks, first_codepoint)
         )
         # drop empty glyphs
         if not keep_empty:
@@ -182,16 +189,22 @@ if Image:
 
     def _identify_colours(crops, background):
         """Identify paper and ink colours from cells."""
+        # count pixels per colour, letting PIL do the counting per cell
+        colourfreq = Counter()
+        for _crop in crops:
+            colours = _crop.getcolors(_crop.width * _crop.height)
+            colourfreq.update({_c: _n for _n, _c in colours})
         # check that cells are monochrome
-        crops = tuple(tuple(_crop.getdata()) for _crop in crops)
-        colourset = set.union(*(set(_data) for _data in crops))
+        colourset = set(colourfreq)
         if len(colourset) > 2:
             raise FileFormatError(
                 f'More than two colours ({len(colourset)}) found in image. '
                 'Colour, greyscale and antialiased glyphs are not supported. '
             )
-        colourfreq = Counter(_c for _data in crops for _c in _data)
-        brightness = sorted((sum(_v for _v in _c), _c) for _c in colourset)
+        brightness = sorted(
+            (sum(_c) if isinstance(_c, tuple) else _c, _c)
+            for _c in colourset
+        )
         if background == 'most-common':
             # most common colour in image assumed to be background colour
             paper, _ = colourfreq.most_common(1)[0]
@@ -206,24 +219,34 @@ if Image:
             _, paper = brightness[0]
         elif background == 'top-left':
             # top-left pixel of first char assumed to be background colour
-            paper = crops[0][0]
+            paper = crops[0].getpixel((0, 0))
         # 2 colour image - not-paper means ink
         ink = (colourset - {paper}).pop()
         return paper, ink
 
+    def _get_ink_mask(image, paper):
+        """Get 1-bit image that is set where the pixel colour is not paper."""
+        if image.mode in ('1', 'L'):
+            return image.point(
+                tuple(255 * (_v != paper) for _v in range(256)), '1'
+            )
+        diff = ImageChops.difference(
+            image, Image.new(image.mode, image.size, paper)
+        )
+        # a pixel is ink if any of its bands differs from paper
+        diff = reduce(ImageChops.lighter, diff.split())
+        return diff.point((0,) + (255,)*255, '1')
+
     def _crop_border(image, border):
         """Remove border area from image."""
-        if border is None:
+        if not image.width:
             return image
-        while image.width:
-            right_colours = image.crop((
-                image.width-1, 0, image.width, image.height
-            )).getcolors()
-            if len(right_colours) == 1 and right_colours[0][1] == border:
-                image = image.crop((0, 0, image.width-1, image.height))
-            else:
-                break
-        return image
+        # anything that is not border colour counts as ink here
+        bbox = _get_ink_mask(image, border).getbbox()
+        if not bbox:
+            return image.crop((0, 0, 0, image.height))
+        _, _, right, _ = bbox
+        return image.crop((0, 0, right, image.height))
 
 
     @savers.register(linked=load_image)
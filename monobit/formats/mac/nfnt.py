@@ -10,16 +10,17 @@ licence: https://opensource.org/licenses/MIT
 """
 
 import logging
-from itertools import chain, accumulate
+from collections import defaultdict
+from functools import cache
+from itertools import accumulate, repeat
 
-from ...binary import bytes_to_bits
+from ...binary import bytes_to_bitstr
 from ...struct import bitfield, big_endian as be, little_endian as le
 from ...font import Font
 from ...glyph import Glyph, KernTable
 from ...magic import FileFormatError
 from ...labels import Char
 from ...encoding import charmaps
-from ...raster import Raster
 from ...properties import Props
 
 from .fond import fixed_to_float
@@ -120,72 +121,20 @@ def nfnt_header_struct(base):
     )
 
 
-# location table entry
-def loc_entry_struct(base):
-    return base.Struct(
-        offset='uint16',
-    )
-
-
-# width/offset table entry
-# Width/offset table. For every glyph in the font, this table contains a word with the glyph offset
-# in the high-order byte and the glyph's width, in integer form, in the low-order byte. The value of
-# the offset, when added to the maximum kerning  value for the font, determines the horizontal
-# distance from the glyph origin to the left edge of the bit image of the glyph, in pixels. If this
-# sum is negative, the glyph origin  is to the right of the glyph image's left edge, meaning the
-# glyph kerns to the left.  If the sum is positive, the origin is to the left of the image's left
-# edge. If the sum equals zero, the glyph origin corresponds with the left edge of the bit image.
-# Missing glyphs are represented by a word value of -1. The last word of this table is also -1,
-# representing the end.
-def wo_entry_struct(base):
-    if base == be:
-        return base.Struct(
-            offset='uint8',
-            width='uint8',
-        )
-    else:
-        return base.Struct(
-            width='uint8',
-            offset='uint8',
-        )
-
-# glyph width table entry
-# > Glyph-width table. For every glyph in the font, this table contains a word
-# > that specifies the glyph's fixed-point glyph width at the given point size
-# > and font style, in pixels. The Font Manager gives precedence to the values
-# > in this table over those in the font family glyph-width table. There is an
-# > unsigned integer in the high-order byte and a fractional part in the
-# > low-order byte. This table is optional.
-def width_entry_struct(base):
-    return base.Struct(
-        # divide by 256
-        width='uint16',
-    )
-
-# height table entry
-# Image height table. For every glyph in the font, this table contains a word that specifies the
-# image height of the glyph, in pixels. The image height is the height of the glyph image and is
-# less than or equal to the font height. QuickDraw uses the image height for improved character
-# plotting, because it only draws the visible part of the glyph. The high-order byte of the word is
-# the offset from the top of the font rectangle of the first non-blank (or nonwhite) row in the
-# glyph, and the low-order byte is the number of rows that must be drawn. The Font Manager creates
-# this table.
-def height_entry_struct(base):
-    return base.Struct(
-        offset='uint8',
-        height='uint8',
-    )
+# header struct types for either byte order, created once
+# IIgs NFNTs are little-endian
+_NFNT_HEADERS = {
+    'b': nfnt_header_struct(be),
+    'l': nfnt_header_struct(le),
+}
 
 
 def extract_nfnt(data, offset, endian='big', owt_loc_high=0, font_type=None):
     """Read a MacOS NFNT or FONT resource."""
-    # create struct types; IIgs NFNTs are little-endian
-    base = {'b': be, 'l': le}[endian[:1].lower()]
-    NFNTHeader = nfnt_header_struct(base)
-    LocEntry = loc_entry_struct(base)
-    WOEntry = wo_entry_struct(base)
-    WidthEntry = width_entry_struct(base)
-    HeightEntry = height_entry_struct(base)
+    # get struct types; IIgs NFNTs are little-endian
+    endian = endian[:1].lower()
+    base = {'b': be, 'l': le}[endian]
+    NFNTHeader = _NFNT_HEADERS[endian]
     # font type override (for IIgs)
     if font_type is not None:
         data = font_type + data[2:]
@@ -204,14 +153,15 @@ def extract_nfnt(data, offset, endian='big', owt_loc_high=0, font_type=None):
     # read char tables & bitmaps
     # table offsets
     strike_offset = offset + NFNTHeader.size
-    loc_offset = offset + NFNTHeader.size + fontrec.fRectHeight * fontrec.rowWords * 2
+    loc_offset = strike_offset + fontrec.fRectHeight * fontrec.rowWords * 2
     # bitmap strike
     strike = data[strike_offset:loc_offset]
     # location table
     # number of chars: coded chars plus missing symbol
     n_chars = fontrec.lastChar - fontrec.firstChar + 2
     # loc table should have one extra entry to be able to determine widths
-    loc_table = LocEntry.array(n_chars+1).from_bytes(data, loc_offset)
+    # slicing the array gives us a list of offsets in one go
+    locs = base.uint16.array(n_chars+1).from_bytes(data, loc_offset)[:]
     # width offset table
     # the high word of the table's offset (in words) is either:
     # - stored in a separate header (for IIgs)
@@ -221,61 +171,56 @@ def extract_nfnt(data, offset, endian='big', owt_loc_high=0, font_type=None):
         owt_loc_high = fontrec.nDescent
     # owtTLoc is offset "from itself" to table
     wo_offset = offset + 16 + (fontrec.owTLoc + (owt_loc_high << 16)) * 2
-    wo_table = WOEntry.array(n_chars).from_bytes(data, wo_offset)
-    # the width-offset table has an extra word:
-    # > The last word of this table is also -1, representing the end.
-    width_offset = wo_offset + WOEntry.size * (n_chars+1)
-    height_offset = width_offset
+    # read entries as words, with the offset in the high byte, width in the low
+    wo_table = base.uint16.array(n_chars).from_bytes(data, wo_offset)[:]
     # scalable width table
     if fontrec.fontType.has_width_table:
-        width_table = WidthEntry.array(n_chars).from_bytes(data, width_offset)
-        height_offset += WidthEntry.size * n_chars
+        # the width-offset table has an extra word:
+        # > The last word of this table is also -1, representing the end.
+        width_offset = wo_offset + 2 * (n_chars+1)
+        width_table = base.uint16.array(n_chars).from_bytes(data, width_offset)[:]
+        # fixed-point value, unsigned integer in the high-order byte
+        # and a fractional part in the low-order byte
+        scalable_widths = (f'{_width / 256:.2f}' for _width in width_table)
+    else:
+        scalable_widths = repeat(None)
     # image height table: this can be deduced from the bitmaps
     # https://developer.apple.com/library/archive/documentation/mac/Text/Text-250.html#MARKER-9-414
     # > The Font Manager creates this table.
-    if fontrec.fontType.has_height_table:
-        height_table = HeightEntry.array(n_chars).from_bytes(data, height_offset)
+    # this appears to mean any stored contents may well be meaningless
+    # so we don't read it; it follows the width table, if there is one
     # parse bitmap strike
-    bitmap_strike = bytes_to_bits(strike)
-    rows = [
-        bitmap_strike[_offs:_offs+fontrec.rowWords*16]
-        for _offs in range(0, len(bitmap_strike), fontrec.rowWords*16)
-    ]
+    row_bits = fontrec.rowWords * 16
     # if the font was compressed, we need to XOR the bitmap rows
     if compressed:
-        xoredrows = rows
-        rows = [xoredrows[0]]
-        for row in xoredrows[1:]:
-            rows.append(tuple(_r ^ _p for _r, _p in zip(row, rows[-1])))
-    # extract width from width/offset table
+        # each row is XORed with all rows above it
+        # we get there by XORing with the rows 1, 2, 4, ... above
+        strike_value = int.from_bytes(strike, 'big')
+        shift = row_bits
+        while shift < len(strike) * 8:
+            strike_value ^= strike_value >> shift
+            shift *= 2
+        strike = strike_value.to_bytes(len(strike), 'big')
+    # convert the whole strike to bits in one go
+    bitmap_strike = bytes_to_bitstr(strike)
+    row_starts = range(0, len(bitmap_strike), row_bits)
+    # don't let glyphs run over into the next row
+    locs = [min(_loc, row_bits) for _loc in locs]
+    # extract glyphs and set their metrics in one go
+    # width & offset from width/offset table
     # (do we need to consider the width table, if defined?)
-    locs = [_loc.offset for _loc in loc_table]
-    glyphs = [
-        Glyph([_row[_offs:_next] for _row in rows])
-        for _offs, _next in zip(locs[:-1], locs[1:])
-    ]
-    # add glyph metrics
-    # scalable-width table
-    if fontrec.fontType.has_width_table:
-        glyphs = tuple(
-            # fixed-point value, unsigned integer in the high-order byte
-            # and a fractional part in the low-order byte
-            _glyph.modify(scalable_width=f'{_we.width / 256:.2f}')
-            for _glyph, _we in zip(glyphs, width_table)
-        )
-    # image-height table
-    # > The Font Manager creates this table.
-    # this appears to mean any stored contents may well be meaningless
-    #
-    # if fontrec.fontType.has_height_table:
-    #     glyphs = tuple(
-    #         _glyph.modify(image_height=_he.height, top_offset=_he.offset)
-    #         for _glyph, _he in zip(glyphs, height_table)
-    #     )
-    # width & offset
     glyphs = tuple(
-        _glyph.modify(wo_offset=_wo.offset, wo_width=_wo.width)
-        for _glyph, _wo in zip(glyphs, wo_table)
+        Glyph(
+            tuple(bitmap_strike[_row+_offs:_row+_next] for _row in row_starts),
+            _0='0', _1='1',
+            scalable_width=_width,
+            # in either byte order, the offset is the high byte of the word
+            # so it comes first in big-endian and second in little-endian files
+            wo_offset=_wo >> 8, wo_width=_wo & 0xff,
+        )
+        for _offs, _next, _wo, _width in zip(
+            locs[:-1], locs[1:], wo_table, scalable_widths
+        )
     )
     return dict(
         glyphs=glyphs,
@@ -290,24 +235,33 @@ _COMPRESSED_HEADER = be.Struct(
     decompressedLength='uint32',
 )
 
+# flag bits of each possible control byte, least significant bit first
+_CONTROL_BITS = tuple(
+    tuple(bool(_byte & (1 << _bit)) for _bit in range(8))
+    for _byte in range(256)
+)
+
 def _uncompress_nfnt(data, offset):
     """Decompress a compressed FONT/NFNT resource."""
     header = _COMPRESSED_HEADER.from_bytes(data, offset)
     offset += _COMPRESSED_HEADER.size
     payload = data[offset:offset+header.compressedLength]
-    iter = reversed(payload)
-    output = bytearray()
-    for byte in iter:
-        for bit in reversed(bytes_to_bits(bytes((byte,)))):
-            if bit:
-                output.append(0)
-            else:
-                try:
-                    output.append(next(iter))
-                except StopIteration:
+    # the payload is decoded back to front, filling the output from the end
+    # each control byte produces at most 8 bytes, which are zero unless set
+    output = bytearray(8 * len(payload))
+    start = len(output)
+    pos = len(payload)
+    while pos:
+        pos -= 1
+        for bit in _CONTROL_BITS[payload[pos]]:
+            if not bit:
+                if not pos:
                     break
+                pos -= 1
+                output[start-1] = payload[pos]
+            start -= 1
     # bitmap rows still need to be XORed afterwards
-    return bytes((data[0], data[1] ^ 0x80)) + bytes(reversed(output))
+    return bytes((data[0], data[1] ^ 0x80)) + output[start:]
 
 
 def convert_nfnt(properties, glyphs, fontrec):
@@ -329,40 +283,38 @@ def convert_nfnt(properties, glyphs, fontrec):
     # offset only, not a tightening of the advance width
     if not glyphs:
         return Font()
-    glyphs = tuple(
-        _glyph.modify(
-            left_bearing=_glyph.wo_offset + fontrec.kernMax,
-            right_bearing=(
-                _glyph.wo_width - _glyph.width
-                - (_glyph.wo_offset + fontrec.kernMax)
-            )
-        )
-        if _glyph.wo_width != 0xff and _glyph.wo_offset != 0xff else _glyph
-        for _glyph in glyphs
-    )
-    # store glyph-name encoding table
-    # do this before setting codepoint labels so we don't drop the tag on the 'missing' glyph
     encoding_table = properties.pop('encoding-table', None)
-    if encoding_table:
-        glyphs = tuple(
-            _glyph.modify(tag=encoding_table.get(_glyph.codepoint, ''))
-            for _glyph in glyphs
-        )
-    # codepoint labels
-    labelled = [
-        _glyph.modify(codepoint=(_codepoint,))
-        for _codepoint, _glyph in enumerate(glyphs[:-1], start=fontrec.firstChar)
-    ]
-    # last glyph is the "missing" glyph
-    labelled.append(glyphs[-1].modify(tag='missing'))
-    # drop undefined glyphs & their labels, so long as they're empty
-    glyphs = tuple(
-        _glyph for _glyph in labelled
-        if (_glyph.wo_width != 0xff and _glyph.wo_offset != 0xff) or (_glyph.width and _glyph.height)
-    )
-    # drop mac glyph metrics
-    # keep scalable_width
-    glyphs = tuple(_glyph.drop('wo_offset', 'wo_width') for _glyph in glyphs)
+    # convert metrics and set labels in a single pass over the glyphs
+    last = len(glyphs) - 1
+    converted = []
+    for _index, _glyph in enumerate(glyphs):
+        defined = _glyph.wo_width != 0xff and _glyph.wo_offset != 0xff
+        # drop undefined glyphs & their labels, so long as they're empty
+        if not defined and not (_glyph.width and _glyph.height):
+            continue
+        # drop mac glyph metrics
+        # keep scalable_width
+        changes = dict(wo_offset=None, wo_width=None)
+        if defined:
+            changes.update(
+                left_bearing=_glyph.wo_offset + fontrec.kernMax,
+                right_bearing=(
+                    _glyph.wo_width - _glyph.width
+                    - (_glyph.wo_offset + fontrec.kernMax)
+                ),
+            )
+        # store glyph-name encoding table
+        # look up tags before setting codepoint labels
+        if encoding_table:
+            changes['tag'] = encoding_table.get(_glyph.codepoint, '')
+        if _index < last:
+            # codepoint labels
+            changes['codepoint'] = (fontrec.firstChar + _index,)
+        else:
+            # last glyph is the "missing" glyph
+            changes['tag'] = 'missing'
+        converted.append(_glyph.modify(**changes))
+    glyphs = tuple(converted)
     # store kerning table
     # last as this needs to refer to codepoint labels
     kerning_table = properties.pop('kerning-table', None)
@@ -373,20 +325,21 @@ def convert_nfnt(properties, glyphs, fontrec):
         # > integer part in the high-order 4 bits, and the fractional part in
         # > the low-order 12 bits. The Font Manager measures the distance in pixels
         # > and then multiplies it by the requested point size
-        kern_table = sorted(
-            (
-                _entry.kernFirst, _entry.kernSecond,
+        # index kerning pairs by left-hand codepoint
+        kern_index = defaultdict(dict)
+        for _entry in kerning_table:
+            kern_index[_entry.kernFirst][_entry.kernSecond] = (
                 properties['point_size'] * fixed_to_float(
                     _entry.kernWidth, twos_complement=twos_complement
                 )
             )
-            for _entry in kerning_table
-        )
         glyphs = tuple(
             _glyph.modify(right_kerning=KernTable({
                 _right: f'{_width:.2f}'
-                for _left, _right, _width in kern_table
-                if _glyph.codepoint and _left == int(_glyph.codepoint)
+                for _right, _width in sorted(
+                    kern_index.get(int(_glyph.codepoint), {}).items()
+                    if _glyph.codepoint else ()
+                )
             }))
             for _glyph in glyphs
         )
@@ -424,6 +377,12 @@ def create_nfnt(
     return data, nfnt_data.owt_loc_high, nfnt_data.fbr_extent
 
 
+@cache
+def _mac_roman_labels():
+    """Char labels for the mac-roman character set, in codepoint order."""
+    return tuple(Char(_c) for _i, _c in sorted(charmaps['mac-roman'].mapping.items()))
+
+
 def subset_for_nfnt(font):
     """Subset to glyphs storable in NFNT and append default glyph."""
     font = font.label(codepoint_from=font.encoding)
@@ -440,7 +399,7 @@ def subset_for_nfnt(font):
         # NFNT can only store encodings from a pre-defined list of 'scripts'
         # for fonts with other encodings, get glyphs corresponding to mac-roman
         font = font.label()
-        labels = tuple(Char(_c) for _i, _c in sorted(charmaps['mac-roman'].mapping.items()))
+        labels = _mac_roman_labels()
     subfont = font.subset(labels=labels)
     if not subfont.glyphs:
         raise FileFormatError('No suitable characters for NFNT font')
@@ -459,17 +418,27 @@ def _normalize_glyph(g, ink_bounds):
     """
     if not g:
         return None
-    # shrink to fit
-    g = g.reduce()
-    return g.expand(
-        bottom=g.shift_up - ink_bounds.bottom,
-        top=ink_bounds.top-g.height-g.shift_up
-    )
+    left, bottom, right, top = g.padding
+    if bottom == g.height:
+        # no ink: shrink to nothing, then expand
+        g = g.reduce()
+        return g.expand(
+            bottom=g.shift_up - ink_bounds.bottom,
+            top=ink_bounds.top-g.height-g.shift_up
+        )
+    # rows to remove to match the font's ink bounds; negative means add
+    # the glyph's ink lies within these bounds, so we never crop into it
+    bottom = ink_bounds.bottom - g.shift_up
+    top = g.shift_up + g.height - ink_bounds.top
+    # crop in one go, only expanding where the raster falls short
+    g = g.crop(left, max(0, bottom), right, max(0, top))
+    return g.expand(bottom=max(0, -bottom), top=max(0, -top))
 
 
 def _normalize_metrics(font):
     """Reduce to ink bounds horizontally, font ink bounds vertically."""
-    glyphs = tuple(_normalize_glyph(_g, font.ink_bounds) for _g in font.glyphs)
+    ink_bounds = font.ink_bounds
+    glyphs = tuple(_normalize_glyph(_g, ink_bounds) for _g in font.glyphs)
     font = font.modify(glyphs)
     return font
 
@@ -479,32 +448,37 @@ def _calculate_nfnt_glyph_metrics(glyphs):
     # calculate maximum kerning (=most negative bearing), zero if all bearings positive
     # this equals the kernMax field of the fontRec
     kern_max = min(0, min(_g.left_bearing for _g in glyphs if _g))
-    # add apple metrics to glyphs
-    glyphs = tuple(
-        (
-            None if _g is None else
-            _g.modify(wo_offset=_g.left_bearing-kern_max, wo_width=_g.advance_width)
-        )
-        for _g in glyphs
-    )
+    # add apple metrics to glyphs and fill in empties, in a single sweep
+    empty = Glyph(wo_offset=255, wo_width=255)
+    nfnt_glyphs = []
+    max_wo_width, max_wo_offset = 0, 0
+    for _g in glyphs:
+        if _g is None:
+            nfnt_glyphs.append(empty)
+            continue
+        wo_offset, wo_width = _g.left_bearing - kern_max, _g.advance_width
+        if _g:
+            max_wo_width = max(max_wo_width, wo_width)
+            max_wo_offset = max(max_wo_offset, wo_offset)
+        nfnt_glyphs.append(_g.modify(wo_offset=wo_offset, wo_width=wo_width))
     # check that glyph widths and offsets fit
-    if any(_g.wo_width >= 255 for _g in glyphs if _g):
+    if max_wo_width >= 255:
         raise FileFormatError('NFNT character width must be < 255')
-    if any(_g.wo_offset >= 255 for _g in glyphs if _g):
+    if max_wo_offset >= 255:
         raise FileFormatError('NFNT character offset must be < 255')
-    empty = Glyph(wo_offset=255, wo_width=255)
-    glyphs = tuple(empty if _g is None else _g for _g in glyphs)
-    return glyphs
+    return tuple(nfnt_glyphs)
 
 
 def generate_nfnt_header(font, endian):
     """Generate a bare NFNT header with no bitmaps yet."""
-    base = {'b': be, 'l': le}[endian[:1].lower()]
-    NFNTHeader = nfnt_header_struct(base)
+    NFNTHeader = _NFNT_HEADERS[endian[:1].lower()]
     FontType = NFNTHeader.element_types['fontType']
     # subset_for_nfnt has sorted on codepoint and added a 'missing' glyph
-    first_char = int(min(font.get_codepoints()))
-    last_char = int(max(font.get_codepoints()))
+    codepoints = font.get_codepoints()
+    first_char = int(min(codepoints))
+    last_char = int(max(codepoints))
+    ink_bounds = font.ink_bounds
+    bounding_box = font.bounding_box
     # generate NFNT header
     fontrec = NFNTHeader(
         # this seems to be always 0x9000, 0xb000
@@ -522,20 +496,20 @@ def generate_nfnt_header(font, endian):
         # to the left, the amount is represented as a negative number. If the glyph origin
         # lies on the left edge of the font rectangle, the value of the kernMax field is 0
         kernMax=min(0, min(_g.left_bearing for _g in font.glyphs)),
-        nDescent=font.ink_bounds.bottom,
+        nDescent=ink_bounds.bottom,
         # font rectangle == font bounding box
-        fRectWidth=font.bounding_box.x,
-        fRectHeight=font.bounding_box.y,
+        fRectWidth=bounding_box.x,
+        fRectHeight=bounding_box.y,
         # word offset to width/offset table
         # keep 0 for empty NFNT
         owTLoc=0,
         # docs define fRectHeight = ascent + descent
         # and generally suggest ascent and descent equal ink bounds
         # that's also monobit's *default* ascent & descent but is overridable
-        ascent=font.ink_bounds.top,
-        descent=-font.ink_bounds.bottom,
+        ascent=ink_bounds.top,
+        descent=-ink_bounds.bottom,
         # define leading in terms of bounding box, not pixel-height
-        leading=font.line_height - font.bounding_box.y,
+        leading=font.line_height - bounding_box.y,
         # rowWords is 0 for empty NFNT, strike width in words for NFNT with bitmaps.
         rowWords=0,
     )
@@ -554,17 +528,14 @@ def convert_to_nfnt(
     # fontType is ignored
     # glyph-width table and image-height table not included
     base = {'b': be, 'l': le}[endian[:1].lower()]
-    LocEntry = loc_entry_struct(base)
-    WOEntry = wo_entry_struct(base)
-    WidthEntry = width_entry_struct(base)
-    HeightEntry = height_entry_struct(base)
     font = _normalize_metrics(font)
     # get contiguous glyph list
     # subset_for_nfnt has sorted on codepoint and added a 'missing' glyph
-    if not font.get_codepoints():
+    codepoints = font.get_codepoints()
+    if not codepoints:
         raise ValueError('No storable codepoints in font.')
-    first_char = int(min(font.get_codepoints()))
-    last_char = int(max(font.get_codepoints()))
+    first_char = int(min(codepoints))
+    last_char = int(max(codepoints))
     glyph_table = [
         font.get_glyph(codepoint=_code, missing=None)
         for _code in range(first_char, last_char+1)
@@ -573,43 +544,60 @@ def convert_to_nfnt(
     glyph_table.append(font.glyphs[-1])
     # calculate glyph metrics and fill in empties
     glyph_table = _calculate_nfnt_glyph_metrics(glyph_table)
-    # build the font-strike data
-    strike_raster = Raster.concatenate(*(_g.pixels for _g in glyph_table))
+    # build the font-strike data, joining the glyphs row by row as bit strings
+    strike_rows = tuple(
+        ''.join(_row)
+        for _row in zip(*(
+            _g.pixels.as_text(ink='1', paper='0').splitlines()
+            for _g in glyph_table if _g.width
+        ))
+    )
     # word-align strike
-    strike_raster = strike_raster.expand(right=16-(strike_raster.width%16))
-    font_strike = strike_raster.as_bytes()
+    row_words = len(strike_rows[0]) // 16 + 1 if strike_rows else 1
+    # pack all rows into bytes at once
+    font_strike = b''
+    if strike_rows:
+        font_strike = int(
+            ''.join(_row.ljust(row_words * 16, '0') for _row in strike_rows), 2
+        ).to_bytes(row_words * 2 * len(strike_rows), 'big')
+    # collect the glyph metrics for the tables in one pass
+    # each width-offset entry is a word with the offset in the high byte,
+    # width in the low; glyph.wo_width and .wo_offset set in normalise_metrics
+    widths, wo_words = zip(*(
+        (_g.width, _g.wo_offset << 8 | _g.wo_width)
+        for _g in glyph_table
+    ))
     # build the width-offset table
-    empty = Glyph(wo_offset=255, wo_width=255)
-    wo_table = b''.join(
-        # glyph.wo_width and .wo_offset set in normalise_metrics
-        bytes(WOEntry(width=_g.wo_width, offset=_g.wo_offset))
+    wo_table = bytes(base.uint16.array(len(glyph_table)+1)(
+        *wo_words,
         # extra empty entry needed at the end.
-        for _g in chain(glyph_table, [empty])
-    )
+        0xffff,
+    ))
     # build the location table
-    loc_table = b''.join(
-        bytes(LocEntry(offset=_offset))
-        for _offset in accumulate((_g.width for _g in glyph_table), initial=0)
-    )
+    loc_table = bytes(base.uint16.array(len(glyph_table)+1)(
+        *accumulate(widths, initial=0)
+    ))
     # build the glyph-width table
     if create_width_table:
-        width_table = b''.join(
-            bytes(WidthEntry(width=int(round(_g.scalable_width * 256))))
-            for _g in glyph_table
-        )
+        width_table = bytes(base.uint16.array(len(glyph_table))(
+            *(int(round(_g.scalable_width * 256)) for _g in glyph_table)
+        ))
     else:
         width_table = b''
     # build the image-height table
     # this isn't tested and probably won't be - seems this table gets ignored
     if create_height_table:
-        height_table = b''.join(
-            bytes(HeightEntry(
+        font_top = font.ink_bounds.top
+        # each entry is two bytes, which are not affected by endianness
+        height_table = bytes(
+            _byte
+            for _g in glyph_table
+            for _byte in (
                 # offset from top line to first ink row
                 # for normalised glyphs, this is the same as top padding
-                offset=font.ink_bounds.top-_g.ink_bounds.top,
-                height=_g.bounding_box.y
-            ))
-            for _g in glyph_table
+                font_top-_g.ink_bounds.top,
+                _g.bounding_box.y,
+            )
         )
     else:
         height_table = b''
@@ -626,7 +614,7 @@ def convert_to_nfnt(
     if ndescent_is_high and owt_loc_high:
         fontrec.nDescent = owt_loc_high
     # fill in the rowWords, indicating that we do have a strike.
-    fontrec.rowWords = strike_raster.width // 16
+    fontrec.rowWords = row_words
     # fbr = max width from origin (including whitespace) and right kerned pixels
     # for IIgs header
     fbr_extent = max(
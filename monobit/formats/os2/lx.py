@@ -93,12 +93,12 @@ def read_lx(instream, all_type_ids):
     if not lx_hd.cres:
         raise FileFormatError('No resources found in LX file.')
     # Now look for font resources
-    cb_rte = LXRTENTRY.size
+    # read the whole resource table in one go
+    res_table = LXRTENTRY.array(lx_hd.cres).read_from(
+        instream, ulAddr + lx_hd.res_tbl
+    )
     ulResID = ()
-    for i in range(lx_hd.cres):
-        cbInc = cb_rte * i
-        instream.seek(ulAddr + lx_hd.res_tbl + cbInc)
-        lx_rte = LXRTENTRY.read_from(instream)
+    for lx_rte in res_table:
         # don't insist on the type being 7 if the id matches the font directory
         if not all_type_ids and (
                 lx_rte.type not in (OS2RES_FONTFACE, OS2RES_FONTDIR)
@@ -168,18 +168,15 @@ def _lx_extract_resource(instream, lx_hd, lx_rte, ulBase):
     instream.seek(ulBase + lx_hd.obj_tbl + cb_obj * (lx_rte.obj-1))
     lx_obj = LXOTENTRY.read_from(instream)
     # Locate & read the object page table entries for this object
-    cbData = 0
-    # - go to the first indicated entry in the pagemap
-    instream.seek(ulBase + lx_hd.objmap + cb_pme * (lx_obj.pagemap-1))
-    # - read the indicated number of pages from this point
-    plxpages = []
-    for _ in range(lx_obj.mapsize):
-        lx_opm = LXOPMENTRY.read_from(instream)
-        if lx_opm.flags in (OP32_ITERDATA, OP32_ITERDATA2):
-            cbData += 4096
-        else:
-            cbData += lx_opm.size
-        plxpages.append(lx_opm)
+    # - read the indicated number of pages from the first indicated entry
+    # unpack the entries once, as we go through them twice
+    plxpages = tuple(LXOPMENTRY.array(lx_obj.mapsize).read_from(
+        instream, ulBase + lx_hd.objmap + cb_pme * (lx_obj.pagemap-1)
+    ))
+    cbData = sum(
+        4096 if _opm.flags in (OP32_ITERDATA, OP32_ITERDATA2) else _opm.size
+        for _opm in plxpages
+    )
     if cbData >= lx_rte.offset + lx_rte.cb - 1:
         # Now read each page from its indicated location into our buffer
         pBuf = bytearray()
@@ -220,9 +217,7 @@ def _lx_unpack1(pBuf):
         ofIn += 2
         if len(abOut) + usReps * usLen > 4096:
             break
-        while usReps:
-            abOut.extend(pBuf[ofIn:ofIn+usLen])
-            usReps -= 1
+        abOut.extend(pBuf[ofIn:ofIn+usLen] * usReps)
         ofIn += usLen
         if ofIn >= cbPage:
             break
@@ -243,7 +238,9 @@ def _lx_unpack2(pBuf):
     ofIn  = 0
     abOut = bytearray()
     while True:
-        ulControl = int(le.uint16.from_bytes(pBuf, ofIn))
+        if ofIn + 2 > cbPage:
+            raise FileFormatError('Truncated EXEPACK2 page.')
+        ulControl = pBuf[ofIn] | (pBuf[ofIn+1] << 8)
         # Bits 1 & 0 hold the case flag (0-3); the interpretation of the
         # remaining bits depend on the flag value.
         case_flag = ulControl & 0x3
@@ -256,8 +253,10 @@ def _lx_unpack2(pBuf):
                 ulLen = ulControl >> 8
                 if not ulLen:
                     break
+                if ofIn + 3 > cbPage:
+                    raise FileFormatError('Truncated EXEPACK2 page.')
                 # memset( abOut + ofOut, *(pBuf + ofIn + 2), ulLen );
-                abOut.extend([pBuf[ofIn + 2]] * ulLen)
+                abOut.extend(bytes((pBuf[ofIn+2],)) * ulLen)
                 ofIn += 3
             else:
                 # block copy (length1) bytes from after ulControl
@@ -284,7 +283,9 @@ def _lx_unpack2(pBuf):
             _copy_byte_seq(abOut, -((ulControl >> 4) & 0xFFF), ulLen)
             ofIn  += 2
         elif case_flag == 3:
-            ulControl = int(le.uint32.from_bytes(pBuf, ofIn))
+            if ofIn + 4 > cbPage:
+                raise FileFormatError('Truncated EXEPACK2 page.')
+            ulControl |= (pBuf[ofIn+2] << 16) | (pBuf[ofIn+3] << 24)
             # bits 23..21  = ?
             # bits 20..12  = backwards reference
             # bits 11.. 6  = length2
@@ -307,12 +308,26 @@ def _lx_unpack2(pBuf):
 
 def _copy_byte_seq(target, source_offset, count):
     """
-    Perform a byte-over-byte iterative copy from one byte array into another,
-    or from one point to another within the same array.  Used by LXUnpack2().
+    Perform the equivalent of a byte-over-byte iterative copy from one point
+    to another within the same byte array.  Used by LXUnpack2().
     Note that memcpy() does not work for this purpose, because the source and
     target address spaces could overlap - that is, the end of the source
     sequence could extend into the start of the target sequence, thus copying
     bytes that were previously written by the same call to this function.
+    In that case, the copied sequence repeats with a period equal to the
+    backward distance, so we can still build it from slices.
     """
-    for _ in range(count):
-        target.append(target[source_offset])
+    if not count:
+        return
+    if not target or -source_offset > len(target):
+        raise IndexError('Backward reference outside of unpacked data.')
+    if not source_offset:
+        chunk = target[:1]
+    else:
+        # the chunk ends at the end of the target if the copy overlaps it
+        stop = source_offset + count
+        if stop >= 0:
+            stop = None
+        chunk = target[source_offset:stop]
+    repeats = -(-count // len(chunk))
+    target.extend((chunk * repeats)[:count])
@@ -183,6 +183,32 @@ def _extract_cells(
         byte_order='row-major',
     ):
     """Extract glyphs from bitmap strike with given geometry."""
+    # bytes used by the pixel rows of one strike row
+    strike_size = height * ceildiv(width*cells_per_row, 8)
+    # byte order has no effect if pixel rows are a single byte wide
+    if height and align != 'bit' and (
+            byte_order == 'row-major' or strike_size == height
+        ):
+        # decode all strike rows in one go, leaving out any padding
+        rows = Raster.from_bytes(
+            b''.join(
+                data[_i*bytes_per_row : _i*bytes_per_row + strike_size]
+                for _i in range(nrows)
+            ),
+            width*cells_per_row, nrows*height, align=align,
+        ).as_text(ink='1', paper='0').splitlines()
+        # clip out glyphs
+        return tuple(
+            Raster(
+                tuple(
+                    _row[_j*width : (_j+1)*width]
+                    for _row in rows[_i*height : (_i+1)*height]
+                ),
+                _0='0', _1='1'
+            )
+            for _i in range(nrows)
+            for _j in range(cells_per_row)
+        )
     # extract one strike row at a time
     # note that the strikes may not be immediately contiguous if there's padding
     glyphrows = (
@@ -193,6 +219,9 @@ def _extract_cells(
         )
         for _i in range(nrows)
     )
+    if cells_per_row == 1:
+        # one glyph per strike row, nothing to clip out
+        return tuple(glyphrows)
     # clip out glyphs
     cells = tuple(
         _glyphrow.crop(
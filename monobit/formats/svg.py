@@ -28,6 +28,18 @@ _STYLE_REVERSE_MAP = reverse_dict(_STYLE_MAP)
 
 DEFAULT_NAME = 'missing'
 
+# scan for (optionally negative) numbers and individual command letters
+_PATH_SCAN = re.compile(r'(-?[0-9]+)|([a-zA-Z])').finditer
+# number of arguments for supported path commands
+_PATH_NARGS = {'m': 2, 'l': 2, 'h': 1, 'v': 1, 'z': 0}
+
+# glyph element enclosing a single-stroke path
+_GLYPH_TEMPLATE = (
+    '  <{tag}{attrs}>\n'
+    '    <path{d}\n      fill="none" stroke="currentColor" stroke-width="1"/>\n'
+    '  </{tag}>\n'
+)
+
 
 @loaders.register(
     name='svg',
@@ -39,17 +51,51 @@ DEFAULT_NAME = 'missing'
 )
 def load_svg(instream):
     """Load vector font from Scalable Vector Graphics font."""
-    root = etree.parse(instream).getroot()
+    # parse incrementally and drop glyph elements once they have been read,
+    # so that we don't need to keep the whole document tree in memory
+    events = etree.iterparse(instream, events=('start', 'end'))
+    _, root = next(events)
     if not root.tag.endswith('svg'):
         raise FileFormatError(f'Not an SVG file: root tag is {root.tag}')
-    # the <font> may optionally be enclosed in a <defs> block
-    font = root.find('.//{*}font')
-    if not font:
+    # use the namespace of the root element, if any, rather than matching
+    # wildcard namespaces
+    ns = root.tag[:-len('svg')]
+    font, font_face, missing_glyph = None, None, None
+    glyph_records = []
+    font_depth, depth = None, 1
+    has_children = False
+    for event, elem in events:
+        if event == 'start':
+            depth += 1
+            # the <font> may optionally be enclosed in a <defs> block
+            if font is None and elem.tag == f'{ns}font':
+                font, font_depth = elem, depth
+            continue
+        depth -= 1
+        if font_depth is None or depth != font_depth:
+            if elem is font:
+                # ignore any further fonts
+                font_depth = None
+            continue
+        # this is a direct child of the <font> element
+        has_children = True
+        if elem.tag == f'{ns}font-face':
+            if font_face is None:
+                font_face = elem
+        elif elem.tag == f'{ns}glyph':
+            glyph_records.append(_read_glyph(
+                elem, tag=elem.attrib.get('glyph-name', '')
+            ))
+        elif elem.tag == f'{ns}missing-glyph':
+            if missing_glyph is None:
+                missing_glyph = _read_glyph(elem, tag=DEFAULT_NAME)
+        # we're done with the element, remove it from the tree
+        del font[:]
+    if not has_children:
         raise FileFormatError('Not an SVG font file')
     props = Props(
         font_id=font.attrib.get('id'),
     )
-    font_face = font.find('{*}font-face')
     if font_face is not None:
         weight = max(100, min(900, int(font_face.attrib.get('font-weight', 400))))
         props |= Props(
@@ -62,97 +108,102 @@ def load_svg(instream):
             weight=WEIGHT_MAP[round(weight, -2)],
             slant=_STYLE_MAP.get(font_face.attrib.get('font-style')),
         )
-    glyph_elems = list(font.iterfind('{*}glyph'))
-    missing_glyph = font.find('{*}missing-glyph')
-    if missing_glyph is not None:
-        glyph_elems.append(missing_glyph)
-    # get the first element containing a path definition
-    # either the <glyph> element itself or an enclosed <path>
-    # or that path enclosed in <g>s etc
-    path_elems = (
-        _g.find('.//*[@d]')
-        for _g in glyph_elems
-    )
-    orig_paths = tuple(
-        _g.attrib.get('d', '') if _g is not None else ''
-        for _g in path_elems
-    )
-    # convert path to monobit notation
-    paths = tuple(convert_path(_p) for _p in orig_paths)
-    glyph_props = tuple(
-        dict(
-            char=_g.attrib.get('unicode', ''),
-            advance_width=int(_g.attrib.get('horiz-adv-x', 0)),
-            tag=_g.attrib.get('glyph-name', '')
-        )
-        for _g in glyph_elems
-    )
     if missing_glyph is not None:
-        glyph_props[-1].update(tag=DEFAULT_NAME)
+        glyph_records.append(missing_glyph)
         props |= Props(default_char=DEFAULT_NAME)
     glyphs = tuple(
         Glyph.from_path(
-            _path.shift(0, -props.line_height + props.descent).flip(),
-            **_gprop
+            # convert path to monobit notation
+            convert_path(_path).shift(
+                0, -props.line_height + props.descent
+            ).flip(),
+            **_gprops
         )
-        for _path, _gprop in zip(paths, glyph_props)
+        for _path, _gprops in glyph_records
     )
     return Font(glyphs, **vars(props))
 
+
+def _read_glyph(glyph_elem, tag):
+    """Extract path definition and glyph properties from glyph element."""
+    # get the first element containing a path definition
+    # either the <glyph> element itself or an enclosed <path>
+    # or that path enclosed in <g>s etc
+    path_elem = glyph_elem.find('.//*[@d]')
+    if path_elem is not None:
+        orig_path = path_elem.attrib.get('d', '')
+    else:
+        orig_path = ''
+    return orig_path, dict(
+        char=glyph_elem.attrib.get('unicode', ''),
+        advance_width=int(glyph_elem.attrib.get('horiz-adv-x', 0)),
+        tag=tag,
+    )
+
 def convert_path(svgpath):
     """Convert SVG path to monobit path."""
-    # split into individual letters and groups of digits (including minus sign)
-    splitgroups = re.compile('[-0-9]+|[a-zA-Z]').findall
-    pathit = iter(splitgroups(svgpath))
     x, y = 0, 0
     startx, starty = 0, 0
     path = []
-    try:
-        for item in pathit:
-            if not item:
+    svgcommand = None
+    # numbers collected for the current command; None if none are expected
+    args = None
+    for match in _PATH_SCAN(svgpath):
+        number, letter = match.groups()
+        if letter:
+            if args is not None:
+                raise ValueError(
+                    f'Incomplete SVG path command `{svgcommand}`.'
+                )
+            svgcommand = letter
+            nargs = _PATH_NARGS.get(svgcommand.lower())
+            if nargs is None:
+                raise ValueError('Curves in paths are not supported.')
+            if nargs:
+                args = []
                 continue
-            # if it's a number group, the last character must be a digit
-            # a number group here mean's we're repeating the last svg path command
-            if item[-1].isdigit():
-                ds = int(item)
+        elif svgcommand is None:
+            raise ValueError('SVG path must start with a command.')
+        elif nargs:
+            # a number group here means we're repeating the last command
+            if args is None:
+                args = [int(number)]
+            else:
+                args.append(int(number))
+            if len(args) < nargs:
+                continue
+        if svgcommand in ('m', 'l', 'M', 'L'):
+            dx, dy = args
+            if svgcommand in ('M', 'L'):
+                dx -= x
+                dy -= y
+            if svgcommand in ('m', 'M'):
+                command = StrokePath.MOVE
             else:
-                svgcommand = item
-                ds = None
-            if svgcommand in ('m', 'l', 'M', 'L'):
-                dx = ds if ds is not None else int(next(pathit))
-                dy = int(next(pathit))
-                if svgcommand in ('M', 'L'):
-                    dx -= x
-                    dy -= y
-                if svgcommand in ('m', 'M'):
-                    command = StrokePath.MOVE
-                else:
-                    command = StrokePath.LINE
-            elif svgcommand in ('h', 'v', 'H', 'V'):
-                command = StrokePath.LINE
-                if ds is None:
-                    ds = int(next(pathit))
-                if svgcommand == 'H':
-                    ds -= x
-                elif svgcommand == 'V':
-                    ds -= y
-                if svgcommand in ('H', 'h'):
-                    dx, dy = ds, 0
-                elif svgcommand in ('V', 'v'):
-                    dx, dy = 0, ds
-            elif svgcommand in ('z', 'Z'):
-                # close subpath
-                # we asssume that's from the start or the latest move
                 command = StrokePath.LINE
-                dx, dy = startx - x, starty - y
+        elif svgcommand in ('h', 'v', 'H', 'V'):
+            command = StrokePath.LINE
+            ds, = args
+            if svgcommand == 'H':
+                ds -= x
+            elif svgcommand == 'V':
+                ds -= y
+            if svgcommand in ('H', 'h'):
+                dx, dy = ds, 0
             else:
-                raise ValueError('Curves in paths are not supported.')
-            path.append((command, dx, dy))
-            x += dx
-            y += dy
-            if command == StrokePath.MOVE:
-                startx, starty = x, y
-    except StopIteration:
+                dx, dy = 0, ds
+        else:
+            # close subpath
+            # we asssume that's from the start or the latest move
+            command = StrokePath.LINE
+            dx, dy = startx - x, starty - y
+        args = None
+        path.append((command, dx, dy))
+        x += dx
+        y += dy
+        if command == StrokePath.MOVE:
+            startx, starty = x, y
+    if args is not None:
         logging.warning('Truncated SVG path')
     return StrokePath(path)
 
@@ -175,14 +226,13 @@ def save_svg(fonts, outfile):
         logging.warning(
             "SVG file will have empty glyphs: no stroke path found"
         )
-    outfile = outfile.text
-    outfile.write('<svg>\n')
+    parts = ['<svg>\n']
     font_attr = {
         'id': font.font_id or font.family or '0',
         # default advance
         'horiz-adv-x': ceil(font.average_width),
     }
-    outfile.write(f'<font{attr_str(font_attr, indent=4)}>\n')
+    parts.append(f'<font{attr_str(font_attr, indent=4)}>\n')
     font_face = {
         'font-family': font.family,
         'units-per-em': font.line_height,
@@ -196,21 +246,24 @@ def save_svg(fonts, outfile):
         'font-weight': WEIGHT_REVERSE_MAP.get(font.weight, 400),
         'font-style': _STYLE_REVERSE_MAP.get(font.slant, 'normal'),
     }
-    outfile.write(f'  <font-face{attr_str(font_face, indent=6)}/>\n')
+    parts.append(f'  <font-face{attr_str(font_face, indent=6)}/>\n')
     if font.default_char:
-        _write_glyph(outfile, font, font.get_default_glyph(), tag='missing-glyph')
+        parts.append(_format_glyph(
+            font, font.get_default_glyph(), tag='missing-glyph'
+        ))
     for i, glyph in enumerate(font.glyphs):
         if font.default_char in glyph.tags and len(glyph.get_labels()) == 1:
             # this is *only* the default char, we keep it as missing-glyph
             logging.debug('Skipping default-only glyph `%s`', font.default_char)
             continue
-        _write_glyph(outfile, font, glyph)
-    outfile.write('</font>\n')
-    outfile.write('</svg>\n')
+        parts.append(_format_glyph(font, glyph))
+    parts.append('</font>\n')
+    parts.append('</svg>\n')
+    outfile.text.write(''.join(parts))
 
 
-def _write_glyph(outfile, font, glyph, tag='glyph'):
-    """Write out a glyph to SVG."""
+def _format_glyph(font, glyph, tag='glyph'):
+    """Format a glyph as SVG."""
     if glyph.path:
         path = glyph.path.flip().shift(0, font.line_height-font.descent)
         svgpath = path.as_svg()
@@ -226,8 +279,8 @@ def _write_glyph(outfile, font, glyph, tag='glyph'):
             glyphprops.update({'unicode': charstr})
         if glyph.tags:
             glyphprops.update({'glyph-name': glyph.tags[0]})
-    outfile.write(f'  <{tag}{attr_str(glyphprops, indent=0, sep=" ")}>\n')
-    outfile.write(f'    <path{d}\n      fill="none" stroke="currentColor" stroke-width="1"/>\n')
-    outfile.write(f'  </{tag}>\n')
+    return _GLYPH_TEMPLATE.format(
+        tag=tag, attrs=attr_str(glyphprops, indent=0, sep=' '), d=d,
+    )
     # this is shorter but not recognised as single-stroke font by FontForge
-    #outfile.write(f'  <{tag}{unicode} horiz-adv-x="{glyph.advance_width}"{d}/>\n')
+    #return f'  <{tag}{unicode} horiz-adv-x="{glyph.advance_width}"{d}/>\n'
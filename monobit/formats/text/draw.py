@@ -427,12 +427,15 @@ class NonEmptyBlock(BaseBlock):
 # draw format block readers
 
 
-class DrawComment(NonEmptyBlock):
+# character classes for first-character checks on each line
+_HEXDIGITS = frozenset(string.hexdigits)
+_NOT_COMMENT = frozenset(string.hexdigits + string.whitespace)
+
 
-    notcomment = string.hexdigits + string.whitespace
+class DrawComment(NonEmptyBlock):
 
     def starts(self, line):
-        return line[:1] not in self.notcomment
+        return bool(line) and line[0] not in _NOT_COMMENT
 
     def ends(self, line):
         return not self.starts(line)
@@ -458,7 +461,7 @@ class DrawGlyph(NonEmptyBlock):
     ink = '#'
 
     def starts(self, line):
-        return line and line[:1] in string.hexdigits
+        return bool(line) and line[0] in _HEXDIGITS
 
     def ends(self, line):
         # empty or non-indented
@@ -15,7 +15,7 @@ import logging
 import itertools
 from types import SimpleNamespace
 
-from ...binary import bytes_to_bits, ceildiv, align
+from ...binary import bytes_to_bitstr, ceildiv, align
 from ...struct import little_endian as le
 from ...properties import reverse_dict
 from ...magic import FileFormatError
@@ -402,8 +402,10 @@ def _extract_glyphs_v1(data, win_props):
         ]
     bytewidth = win_props.dfWidthBytes
     offset = win_props.dfBitsOffset
+    # if the resource is cut short, the bottom strike rows are short or empty
+    truncated = len(data) < offset + bytewidth * win_props.dfPixHeight
     strikerows = tuple(
-        bytes_to_bits(data[offset+_row*bytewidth : offset+(_row+1)*bytewidth])
+        bytes_to_bitstr(data[offset+_row*bytewidth : offset+(_row+1)*bytewidth])
         for _row in range(win_props.dfPixHeight)
     )
     glyphs = []
@@ -416,7 +418,15 @@ def _extract_glyphs_v1(data, win_props):
             _srow[offset:offset+width]
             for _srow in strikerows
         )
-        glyph = Glyph(rows, codepoint=(win_props.dfFirstChar + ord,))
+        # a glyph with rows cut short by the truncation cannot be read
+        if truncated and len(set(len(_row) for _row in rows)) > 1:
+            raise FileFormatError(
+                'Glyph strike extends beyond end of FNT resource.'
+            )
+        glyph = Glyph(
+            Raster(rows, _0='0', _1='1'),
+            codepoint=(win_props.dfFirstChar + ord,)
+        )
         glyphs.append(glyph)
     return glyphs
 
@@ -433,11 +443,16 @@ def _extract_glyphs_v2(data, win_props):
         if not entry.geWidth:
             continue
         bytewidth = ceildiv(entry.geWidth, 8)
+        size = bytewidth * height
+        glyph_cols = data[entry.geOffset : entry.geOffset + size]
+        if len(glyph_cols) < size:
+            raise FileFormatError(
+                'Glyph bitmap extends beyond end of FNT resource.'
+            )
         # transpose byte-columns to contiguous rows
-        glyph_data = bytes(
-            data[entry.geOffset + _col * height + _row]
+        glyph_data = b''.join(
+            glyph_cols[_row::height]
             for _row in range(height)
-            for _col in range(bytewidth)
         )
         glyph = Glyph.from_bytes(glyph_data, entry.geWidth).modify(codepoint=(ord,))
         glyphs.append(glyph)
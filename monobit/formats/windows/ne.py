@@ -144,9 +144,9 @@ def read_ne(instream, all_type_ids):
     # stream pointer is at the start of the NE header
     # but some offsets in the file are given from the MZ header before that
     ne_offset = instream.tell()
-    instream.seek(0)
-    data = instream.read()
-    header = NE_HEADER.from_bytes(data, ne_offset)
+    instream.seek(0, 2)
+    file_size = instream.tell()
+    header = NE_HEADER.read_from(instream, ne_offset)
     logging.debug(header)
     if header.ne_exetyp not in (0, 2, 4):
         # 0 unknown (but used by Windows 1.0)
@@ -159,7 +159,9 @@ def read_ne(instream, all_type_ids):
             'Not a Windows NE file: EXE type %d', header.ne_exetyp
         )
     # parse the first elements of the resource table
-    res_table = _RES_TABLE_HEAD.from_bytes(data, ne_offset + header.ne_rsrctab)
+    res_table = _RES_TABLE_HEAD.read_from(
+        instream, ne_offset + header.ne_rsrctab
+    )
     logging.debug(res_table)
     # loop over the rest of the resource table until exhausted
     # we don't know the number of entries
@@ -169,20 +171,23 @@ def read_ne(instream, all_type_ids):
     while True:
         # parse typeinfo excluding nameinfo array (of as yet unknown size)
         type_info_head = type_info_struct(0)
-        type_info = type_info_head.from_bytes(data, ti_offset)
+        type_info = type_info_head.read_from(instream, ti_offset)
         logging.debug(type_info)
         if type_info.rtTypeID == 0:
             # end of resource table
             break
         # type, count, 4 bytes reserved
         nameinfo_array = _NAMEINFO.array(type_info.rtResourceCount)
-        for name_info in nameinfo_array.from_bytes(data, ti_offset + type_info_head.size):
+        name_infos = nameinfo_array.read_from(
+            instream, ti_offset + type_info_head.size
+        )
+        for name_info in name_infos:
             logging.debug(name_info)
             # the are offsets w.r.t. the file start, not the NE header
             # they could be *before* the NE header for all we know
             start = name_info.rnOffset << res_table.rscAlignShift
             size = name_info.rnLength << res_table.rscAlignShift
-            if start < 0 or size < 0 or start + size > len(data):
+            if start < 0 or size < 0 or start + size > file_size:
                 logging.warning('Resource overruns file boundaries, skipped')
                 continue
             if all_type_ids or type_info.rtTypeID == _RT_FONT:
@@ -190,7 +195,8 @@ def read_ne(instream, all_type_ids):
                     'Reading resource of type %d at offset %x [%x]',
                     type_info.rtTypeID, start, name_info.rnOffset
                 )
-                resources.append(data[start : start+size])
+                instream.seek(start)
+                resources.append(instream.read(size))
             else:
                 logging.debug(
                     'Skipping resource of type %d at offset %x [%x]',
@@ -317,10 +323,8 @@ def _create_resident_name_table(pack):
     else:
         name = families[0]
     # Resident name table should just contain a module name.
-    mname = ''.join(
-        _c for _c in name
-        if _c in set(string.ascii_letters + string.digits)
-    )
+    allowed = set(string.ascii_letters + string.digits)
+    mname = ''.join(_c for _c in name if _c in allowed)
     return bytes([len(mname)]) + mname.encode('ascii') + b'\0\0\0'
 
 
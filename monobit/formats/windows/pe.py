@@ -79,17 +79,15 @@ def read_pe(instream, all_type_ids):
     """Read resources from a PE-format FON file."""
     # stream pointer is at the start of the PE header
     peoff = instream.tell()
-    instream.seek(0)
-    data = instream.read()
     # We could try finding the Resource Table entry in the Optional
     # Header, but it talks about RVAs instead of file offsets, so
     # it's probably easiest just to go straight to the section table.
     # So let's find the size of the Optional Header, which we can
     # then skip over to find the section table.
-    pe_header = _PE_HEADER.from_bytes(data, peoff)
+    pe_header = _PE_HEADER.read_from(instream, peoff)
     section_table_offset = peoff + _PE_HEADER.size + pe_header.SizeOfOptionalHeader
     section_table_array = _IMAGE_SECTION_HEADER.array(pe_header.NumberOfSections)
-    section_table = section_table_array.from_bytes(data, section_table_offset)
+    section_table = section_table_array.read_from(instream, section_table_offset)
     # find the resource section
     for section in section_table:
         if section.Name == b'.rsrc':
@@ -103,8 +101,9 @@ def read_pe(instream, all_type_ids):
         logging.debug('Skipping section `%s`', section.Name.decode('latin-1'))
     else:
         raise FileFormatError('Unable to locate resource section')
-    # Now we've found the resource section, let's throw away the rest.
-    rsrc = data[section.PointerToRawData : section.PointerToRawData+section.SizeOfRawData]
+    # Now we've found the resource section, we don't need to read the rest.
+    instream.seek(section.PointerToRawData)
+    rsrc = instream.read(section.SizeOfRawData)
     # Now the fun begins. To start with, we must find the initial
     # Resource Directory Table and look up type 0x08 (font) in it.
     # If it yields another Resource Directory Table, we recurse
@@ -6,13 +6,12 @@ licence: https://opensource.org/licenses/MIT
 """
 
 import logging
-from functools import cache
 
 from .encoding import is_graphical, is_blank
 from .labels import Codepoint, Char, Tag, to_label
 from .raster import Raster, NOT_SET, turn_method
 from .properties import Props, extend_string
-from .cachedprops import HasProps, checked_property, writable_property
+from .cachedprops import HasProps, checked_property, writable_property, cached
 from .basetypes import Coord, Bounds, to_number
 from .scripting import scriptable
 from .vector import StrokePath
@@ -108,6 +107,8 @@ class GlyphProperties:
 class Glyph(HasProps):
     """Single glyph including raster and properties."""
 
+    __slots__ = ('_pixels', '_labels', '_comment')
+
     _defaults = vars(GlyphProperties)
     _converters = HasProps.get_converters(GlyphProperties)
 
@@ -146,25 +147,21 @@ class Glyph(HasProps):
     def ink_bounds(self):
         """Minimum box encompassing all ink, relative to bottom left."""
         # pylint: disable=no-member
-        bounds = Bounds(
-            self.raster.left + self.padding.left,
-            self.raster.bottom + self.padding.bottom,
-            self.raster.right - self.padding.right,
-            self.raster.top - self.padding.top,
-        )
+        left, bottom, right, top = self.raster
+        pad_left, pad_bottom, pad_right, pad_top = self.padding
+        left, bottom = left + pad_left, bottom + pad_bottom
+        right, top = right - pad_right, top - pad_top
         # more intuitive result for blank glyphs
-        if bounds.left == bounds.right or bounds.top == bounds.bottom:
+        if left == right or top == bottom:
             return Bounds(0, 0, 0, 0)
-        return bounds
+        return Bounds(left, bottom, right, top)
 
     @checked_property
     def bounding_box(self):
         """Dimensions of minimum bounding box encompassing all ink."""
         # pylint: disable=no-member
-        return Coord(
-            self.ink_bounds.right - self.ink_bounds.left,
-            self.ink_bounds.top - self.ink_bounds.bottom
-        )
+        left, bottom, right, top = self.ink_bounds
+        return Coord(right - left, top - bottom)
 
     @checked_property
     def padding(self):
@@ -409,7 +406,7 @@ class Glyph(HasProps):
     def comment(self):
         return self._comment
 
-    @cache
+    @cached
     def has_vertical_metrics(self):
         """Check if this glyph has vertical metrics."""
         return any(
@@ -434,14 +431,16 @@ class Glyph(HasProps):
 
     @property
     def char(self):
-        if self.chars:
-            return self.chars[0]
+        for _label in self._labels:
+            if isinstance(_label, Char):
+                return _label
         return Char()
 
     @property
     def codepoint(self):
-        if self.codepoints:
-            return self.codepoints[0]
+        for _label in self._labels:
+            if isinstance(_label, Codepoint):
+                return _label
         return Codepoint()
 
     def get_labels(self):
@@ -942,14 +941,19 @@ class Glyph(HasProps):
         Minimum box encompassing all glyph matrices overlaid at fixed origin.
         """
         #self = glyphs[0]
-        # raster edges
-        rasters = tuple(_g.raster for _g in glyphs)
-        return Bounds(
-            left=min(_r.left for _r in rasters),
-            bottom=min(_r.bottom for _r in rasters),
-            right=max(_r.right for _r in rasters),
-            top=max(_r.top for _r in rasters)
-        )
+        # raster edges, in a single pass over the glyphs
+        left, bottom, right, top = glyphs[0].raster
+        for _glyph in glyphs[1:]:
+            _left, _bottom, _right, _top = _glyph.raster
+            if _left < left:
+                left = _left
+            if _bottom < bottom:
+                bottom = _bottom
+            if _right > right:
+                right = _right
+            if _top > top:
+                top = _top
+        return Bounds(left, bottom, right, top)
 
     # pylint: disable=no-method-argument
     def overlay(*glyphs, operator=any):
@@ -5,9 +5,11 @@ monobit.label - yaff representation of labels
 licence: https://opensource.org/licenses/MIT
 """
 
+import sys
 from string import ascii_letters, digits
 from unicodedata import normalize
 from itertools import count
+from functools import lru_cache
 
 from .binary import ceildiv, int_to_bytes, bytes_to_int
 from .scripting import to_int
@@ -35,6 +37,8 @@ def strip_matching(from_str, char, allow_no_match=True):
 class Label:
     """Label."""
 
+    __slots__ = ()
+
 
 def to_label(value):
     """Convert to codepoint/unicode/tag label from yaff file."""
@@ -45,6 +49,9 @@ def to_label(value):
         return Codepoint(value)
     if not value:
         return Char()
+    # length-one -> always a character, unless it's a digit
+    if len(value) == 1 and not value.isdecimal():
+        return Char(value)
     # protect commas, pluses etc. if enclosed
     try:
         # strip matching double quotes
@@ -61,9 +68,6 @@ def to_label(value):
         return Codepoint(value)
     except ValueError:
         pass
-    # length-one -> always a character
-    if len(value) == 1:
-        return Char(value)
     # unquoted non-ascii -> always a character (this is to cover grapheme sequences)
     # note that this includes non-printables such as controls but these should not be used.
     if any(ord(_c) > 0x7f for _c in value):
@@ -78,6 +82,7 @@ def to_label(value):
         pass
     return Tag(value.strip())
 
+@lru_cache(maxsize=4096)
 def _convert_char_element(element):
     """Convert character label element to char if possible."""
     # string delimited by single quotes denotes a character or sequence
@@ -105,6 +110,8 @@ CONVERTERS[Label] = to_label
 class Char(str, Label):
     """Character label."""
 
+    __slots__ = ()
+
     def __new__(cls, value=''):
         """Convert char or char sequence to char label."""
         if isinstance(value, Char):
@@ -124,10 +131,7 @@ class Char(str, Label):
 
     def __str__(self):
         """Convert to unicode label str for yaff."""
-        return ', '.join(
-            f'u+{ord(_uc):04x}'
-            for _uc in self
-        )
+        return ', '.join(map('u+{:04x}'.format, map(ord, self)))
 
     @property
     def value(self):
@@ -141,14 +145,19 @@ class Char(str, Label):
 class Codepoint(bytes, Label):
     """Codepoint label."""
 
+    __slots__ = ()
+
     def __new__(cls, value=b''):
         """Convert to codepoint label if possible."""
+        if isinstance(value, int):
+            # most common case; minimal representation has no zeros to strip
+            return super().__new__(
+                cls, value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')
+            )
         if isinstance(value, Codepoint) or isinstance(value, bytes):
             pass
         elif value is None:
             value = b''
-        elif isinstance(value, int):
-            value = int_to_bytes(value)
         else:
             if isinstance(value, str):
                 # handle composite labels
@@ -203,13 +212,21 @@ class Codepoint(bytes, Label):
 ##############################################################################
 # tags
 
+# characters allowed in unquoted tags; the first must be a letter
+_TAG_FIRST_CHARS = frozenset(ascii_letters)
+_TAG_CHARS = frozenset(ascii_letters + digits + '_-.')
+
+
 class Tag(Label):
     """Tag label."""
 
+    __slots__ = ('_value', '_str')
+
     def __init__(self, value=''):
         """Construct tag object."""
         if isinstance(value, Tag):
             self._value = value.value
+            self._str = str(value)
             return
         if value is None:
             value = ''
@@ -217,8 +234,25 @@ class Tag(Label):
             raise ValueError(
                 f'Cannot convert value {repr(value)} of type {type(value)} to tag.'
             )
+        if len(value) <= 16 and type(value) is str:
+            # share the common short names such as .notdef between glyphs
+            value = sys.intern(value)
         self._value = value
+        # tags are immutable, so we can determine the yaff representation once
+        self._str = self._quote(value)
 
+    @staticmethod
+    def _quote(value):
+        """Quote tag value for yaff, if needed."""
+        # quote otherwise ambiguous/illegal tags
+        # in particular, we need to quote 0x u+ ' ", non-ascii, and single chars
+        if (
+                len(value) < 2
+                or value[0] not in _TAG_FIRST_CHARS
+                or not _TAG_CHARS.issuperset(value)
+            ):
+            return f'"{value}"'
+        return value
 
     def __repr__(self):
         """Represent label."""
@@ -226,18 +260,7 @@ class Tag(Label):
 
     def __str__(self):
         """Convert tag to str."""
-        # quote otherwise ambiguous/illegal tags
-        # in particular, we need to quote 0x u+ ' ", non-ascii, and single chars
-        if (
-                len(self._value) < 2
-                or not (self._value[0] in ascii_letters)
-                or any(
-                    _c not in ascii_letters + digits + '_-.'
-                    for _c in self._value
-                )
-            ):
-            return f'"{self._value}"'
-        return self._value
+        return self._str
 
     def __hash__(self):
         """Allow use as dictionary key."""
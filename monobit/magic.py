@@ -156,9 +156,11 @@ class MagicRegistry:
             return ()
         matches = []
         ## match magic on readable files
-        if file.mode == 'r':
+        if file.mode == 'r' and self._magic:
+            # the registry is sorted long to short, so one peek serves all
+            header = file.peek(len(self._magic[0][0]))
             for magic, converter in self._magic:
-                if magic.fits(file):
+                if magic.matches(header):
                     logging.debug(
                         'Stream matches signature for format `%s`.',
                         converter.format
@@ -166,8 +168,9 @@ class MagicRegistry:
                     matches.append(converter)
         ## match glob patterns
         glob_matches = []
+        filename = Path(file.name).name
         for pattern, converter in self._patterns:
-            if pattern.fits(file):
+            if pattern.matches(filename):
                 logging.debug(
                     'Filename matches pattern for format `%s`.',
                     converter.format
@@ -412,10 +412,14 @@ class Raster:
         heights = set(_raster.height for _raster in row_of_rasters)
         if len(heights) > 1:
             raise ValueError('Rasters must be of same height.')
-        matrices = (_raster.as_matrix() for _raster in row_of_rasters)
+        # join rows as strings, in our own paper and ink characters
+        rows = (
+            _raster.as_text(ink=cls._1, paper=cls._0).splitlines()
+            for _raster in row_of_rasters
+        )
         concatenated = cls(
-            sum(_row, ())
-            for _row in zip(*matrices)
+            cls._outer(''.join(_row) for _row in zip(*rows)),
+            _0=cls._0, _1=cls._1
         )
         return concatenated
 
@@ -223,6 +223,11 @@ class DirectoryStream(Stream):
 
 def is_binary(stream):
     """Check if stream is binary."""
+    # standard library streams tell us by their type
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(stream, io.TextIOBase):
+        return False
     if stream.readable():
         # read 0 bytes - the return type will tell us if this is a text or binary stream
         return isinstance(stream.read(0), bytes)
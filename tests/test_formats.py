@@ -7,6 +7,7 @@ import os
 import unittest
 
 import monobit
+from monobit.formats.svg import convert_path
 from .base import BaseTester, ensure_asset, assert_text_eq
 
 
@@ -91,6 +92,28 @@ class TestFormats(BaseTester):
         self.assertEqual(len(font.glyphs), 256)
         self.assertEqual(font.get_glyph(b'A').reduce().as_text(), self.fixed4x6_A)
 
+    def test_import_fnt_truncated(self):
+        """Test importing fnt files cut short in the glyph bitmaps."""
+        for version in (1, 2, 3):
+            fnt_file = self.temp_path / f'4x6-v{version}.fnt'
+            monobit.save(self.fixed4x6, fnt_file, format='win', version=version)
+            data = fnt_file.read_bytes()
+            fnt_file.write_bytes(data[:len(data)//2])
+            with self.assertRaises(monobit.FileFormatError):
+                font, *_ = monobit.load(fnt_file, format='win')
+
+    def test_import_fnt_v1_truncated_padding(self):
+        """Test importing a v1 fnt file cut short in the strike padding."""
+        fnt_file = self.temp_path / '4x6.fnt'
+        monobit.save(self.fixed4x6, fnt_file, format='win', version=1)
+        data = fnt_file.read_bytes()
+        # strike rows are 1024 pixels in 130 bytes, followed by the face name
+        # cut off the face name and a byte of padding from the last row
+        fnt_file.write_bytes(data[:-8])
+        font, *_ = monobit.load(fnt_file, format='win')
+        self.assertEqual(len(font.glyphs), 256)
+        self.assertEqual(font.get_glyph(b'A').reduce().as_text(), self.fixed4x6_A)
+
     # Windows PE files
     pelib = 'https://github.com/cubiclesoft/windows-pe-artifact-library/raw/master/'
 
@@ -1060,6 +1083,14 @@ class TestFormats(BaseTester):
 @.....@
 """)
 
+    def test_import_os2_lx_truncated(self):
+        """Test importing a truncated LX container."""
+        data = (self.font_path / 'WARPSANS.FON').read_bytes()
+        fon_file = self.temp_path / 'warpsans.fon'
+        fon_file.write_bytes(data[:775])
+        with self.assertRaises(monobit.FileFormatError):
+            font, *_ = monobit.load(fon_file, format='mzfon')
+
     bgafon = 'http://discmaster.textfiles.com/file/21050/NOVEMBER.bin/nov95/nov9/nov9022.zip/whbdlt1.zip/BGAFON.ZIP/'
 
     def test_import_os2_ne(self):
@@ -1232,6 +1263,41 @@ class TestFormats(BaseTester):
         self.assertEqual(len(font.glyphs), 26)
         self.assertEqual(str(font.glyphs[0].path), self.hershey_A_path)
 
+    def test_svg_path(self):
+        """Test converting SVG paths."""
+        # implicit repeats
+        self.assertEqual(
+            str(convert_path('M1 2 3 4 l1 0 0 1')),
+            'm 1 2\nm 2 2\nl 1 0\nl 0 1',
+        )
+        # horizontal and vertical lines, relative and absolute
+        self.assertEqual(
+            str(convert_path('m1 2 h3 v-4 H0 V0')),
+            'm 1 2\nl 3 0\nl 0 -4\nl -4 0\nl 0 2',
+        )
+        # closing the path; numbers after z repeat the close
+        self.assertEqual(
+            str(convert_path('M1 1 l2 0 0 2 z 1')),
+            'm 1 1\nl 2 0\nl 0 2\nl -2 -2\nl 0 0',
+        )
+        # a minus sign starts a new number
+        self.assertEqual(str(convert_path('M1-2')), 'm 1 -2')
+
+    def test_svg_path_truncated(self):
+        """Test converting SVG paths that end in an incomplete command."""
+        with self.assertLogs(level='WARNING'):
+            path = convert_path('M1 2 L3')
+        self.assertEqual(str(path), 'm 1 2')
+
+    def test_svg_path_invalid(self):
+        """Test converting invalid SVG paths."""
+        with self.assertRaises(ValueError):
+            convert_path('1 2')
+        with self.assertRaises(ValueError):
+            convert_path('M1 L2 2')
+        with self.assertRaises(ValueError):
+            convert_path('M0 0 C1 1 2 2 3 3')
+
     def test_import_vector_fon(self):
         """Test importing Hershey font in Windows vector format."""
         font, *_ = monobit.load(self.font_path / 'hershey' / 'hershey.fon')